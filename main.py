@@ -1,14 +1,19 @@
 # main.py
 
+import os
 import sys
-import json
+import enum
+import functools
 import threading
 import time
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable
 
 import av
-from PyQt6.QtCore import Qt, QObject, pyqtSignal, QSize
-from PyQt6.QtGui import QImage, QPixmap, QCursor, QColor, QPalette
+from PyQt6.QtCore import (
+    Qt, QEvent, QObject, QRect, pyqtSignal, QSize, QTimer, QFile, QIODevice, QJsonDocument, QJsonParseError,
+    QThreadPool, QRunnable
+)
+from PyQt6.QtGui import QImage, QCursor, QColor, QPalette, QPainter
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QHBoxLayout, QVBoxLayout,
     QComboBox, QSpinBox, QFileDialog, QMessageBox, QFormLayout, QGridLayout, QFrame,
@@ -29,6 +34,36 @@ DEFAULT_CAMERA_SLUG = "/cam/realmonitor"
 DEFAULT_TRANSPORT = "tcp"
 DEFAULT_LATENCY_MS = 100
 
+# libavcodec threads per stream. Four streams share the machine, so each gets
+# a quarter of the cores instead of libavcodec's one-thread-per-core default.
+DECODER_THREADS = max(1, (os.cpu_count() or 4) // 4)
+DECODER_THREAD_TYPE = "FRAME"
+
+# Rate at which the GUI pulls the newest decoded frame from each worker
+DISPLAY_FPS = 60
+
+# Hardware decoding (needs PyAV 14+). Devices are tried in this order and
+# decoding falls back to software when none is available or init fails.
+HWACCEL_ENABLED = True
+HWACCEL_DEVICES = ("cuda", "vaapi", "videotoolbox", "d3d11va", "dxva2", "qsv")
+
+# Draw video through OpenGL so the GPU uploads and scales each frame. Off by
+# default: remote desktops and some VM drivers render GL widgets black.
+OPENGL_VIDEO = False
+
+# Combo box values; interned so state comparisons and dict hashing stay cheap.
+_CHANNEL_ITEMS = tuple(sys.intern(str(i)) for i in range(1, 17))
+_SUBTYPE_ITEMS = tuple(sys.intern(v) for v in ("0", "1", "2"))
+_TRANSPORTS = tuple(sys.intern(v) for v in ("tcp", "udp"))
+
+# Panel state keys mirrored by the active-panel form.
+_UI_STATE_KEYS = (
+    "title", "user", "pass", "ip", "port", "slug", "channel", "subtype", "transport", "latency",
+)
+
+# Bound formatter for the RTSP URL layout; the template is parsed once here.
+_RTSP_URL_FORMAT = "rtsp://{cred}{ip}:{port}{slug}?channel={channel}&subtype={subtype}".format_map
+
 # ============================================================================
 # VideoWorker Class (from video_worker.py)
 # ============================================================================
@@ -42,18 +77,70 @@ except Exception:
     except Exception:
         AvError = Exception  # last-resort fallback
 
+# Display frames use QImage.Format_RGB32 (0xffRRGGBB words), Qt's native pixmap
+# format, so fromImage needs no conversion. Its byte order follows endianness.
+_DISPLAY_PIX_FMT = "bgra" if sys.byteorder == "little" else "argb"
+
+try:
+    from av.video.reformatter import VideoReformatter
+except Exception:
+    VideoReformatter = None
+
+# Hardware decode support is optional across PyAV versions
+try:
+    from av.codec.hwaccel import HWAccel, hwdevices_available
+except Exception:
+    HWAccel = None
+
+
+def _hwaccel_devices() -> List[str]:
+    """
+    Device types from HWACCEL_DEVICES that FFmpeg was built with, in order.
+    Being compiled in says nothing about the machine having the hardware;
+    VideoWorker finds that out when the device is created in av.open.
+    """
+    if not HWACCEL_ENABLED or HWAccel is None:
+        return []
+    try:
+        available = set(hwdevices_available())
+    except Exception:
+        return []
+    return [device for device in HWACCEL_DEVICES if device in available]
+
+
+class FrameImage(QImage):
+    """QImage over a decoded pixel buffer that keeps the buffer referenced for its lifetime."""
+
+    def __init__(self, buf: Any, width: int, height: int, stride: int, fmt: QImage.Format):
+        # buf is any buffer-protocol object: an ndarray or a PyAV frame plane
+        view = memoryview(buf)
+        super().__init__(view, width, height, stride, fmt)
+        self._buf = view
+
 
 class VideoWorker(QObject):
-    frame_ready = pyqtSignal(QImage)
+    # Decoded frames are not signalled; the GUI polls take_frame() at DISPLAY_FPS.
     status = pyqtSignal(str)
     stopped = pyqtSignal()
     recording_status = pyqtSignal(bool)  # True when recording, False when stopped
 
-    def __init__(self):
+    def __init__(self, name: str = "VideoWorker"):
         super().__init__()
+        self._name = name
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
-        self._last_qimage: Optional[QImage] = None
+        self._last_frame: Optional[Any] = None  # last decoded av.VideoFrame, full resolution
+        # Hardware devices still worth trying, best first. A device is dropped
+        # for good once it fails to open where software decoding works.
+        self._hw_devices = _hwaccel_devices()
+        # Single-slot handoff to the GUI thread; the newest frame wins. A frame
+        # is one QImage per display target, in set_target_sizes() order.
+        self._pending: Optional[Tuple[QImage, ...]] = None
+        self._pending_lock = threading.Lock()
+        self._dropped_frames = 0
+        self._drop_window_start = time.monotonic()
+        # Bounding boxes (w, h) frames are scaled into before emission; empty keeps source size
+        self._target_sizes: Tuple[Tuple[int, int], ...] = ()
         self._recording = False
         self._recording_lock = threading.Lock()
         self._output_container: Optional[Any] = None
@@ -65,21 +152,129 @@ class VideoWorker(QObject):
     def start(self, url: str, transport: str, latency_ms: int):
         self.stop()
         self._stop.clear()
+        with self._pending_lock:
+            self._pending = None
+        # One thread per stream: PyAV demux/decode block in FFmpeg I/O, and
+        # the RTSP handshake runs there too, so start() returns immediately
         self._thread = threading.Thread(
-            target=self._run, args=(url, transport, latency_ms), daemon=True
+            target=self._run, args=(url, transport, latency_ms),
+            name=f"{self._name}-decode", daemon=True
         )
         self._thread.start()
 
     def stop(self):
+        self.request_stop()
+        self.wait_stopped(2.0)
+
+    def request_stop(self):
+        """Ask the decode thread to exit without waiting; `stopped` fires when it has."""
         if self._thread and self._thread.is_alive():
             self._stop.set()
-            self._thread.join(timeout=2)
-        self._thread = None
+
+    def wait_stopped(self, timeout: float) -> bool:
+        """Join the decode thread for up to `timeout` seconds. Returns True if it exited."""
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return True
+        thread.join(timeout=max(0.0, timeout))
+        return not thread.is_alive()
+
+    def is_active(self) -> bool:
+        """Check if the decode thread is still alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def take_frame(self) -> Optional[Tuple[QImage, ...]]:
+        """
+        Pop the newest undelivered frame as one image per display target, or
+        None if it was already taken. Targets whose fitted size coincides
+        share the same QImage.
+        """
+        with self._pending_lock:
+            images, self._pending = self._pending, None
+        return images
+
+    def dropped_frames_per_second(self) -> float:
+        """Rate of frames overwritten before display since the previous call."""
+        now = time.monotonic()
+        with self._pending_lock:
+            dropped, self._dropped_frames = self._dropped_frames, 0
+        elapsed, self._drop_window_start = now - self._drop_window_start, now
+        return dropped / elapsed if elapsed > 0 else 0.0
+
+    def _publish_frame(self, images: Tuple[QImage, ...]):
+        with self._pending_lock:
+            if self._pending is not None:
+                self._dropped_frames += 1
+            self._pending = images
+
+    def set_target_sizes(self, *sizes: Tuple[int, int]):
+        """
+        Set one display box per consumer of this stream. Each decoded frame is
+        scaled once per distinct fitted size and take_frame() returns the
+        images in the same order. A (0, 0) box keeps the source size.
+        """
+        self._target_sizes = tuple((w, h) if w > 0 and h > 0 else (0, 0) for w, h in sizes)
+
+    def _display_sizes(self, width: int, height: int) -> List[Tuple[int, int]]:
+        sizes = []
+        for tw, th in self._target_sizes or ((0, 0),):
+            if tw <= 0:
+                sizes.append((width, height))
+                continue
+            fit = QSize(width, height).scaled(tw, th, Qt.AspectRatioMode.KeepAspectRatio)
+            sizes.append((max(1, fit.width()), max(1, fit.height())))
+        return sizes
+
+    @staticmethod
+    def _to_display_image(frame: Any, size: Tuple[int, int], reformatters: Dict[Tuple[int, int], Any]) -> QImage:
+        """Scale a decoded frame to `size` as RGB32 and wrap the result without copying."""
+        dw, dh = size
+        if VideoReformatter is not None:
+            reformatter = reformatters.get(size)
+            if reformatter is None:
+                reformatter = reformatters[size] = VideoReformatter()
+            rgb = reformatter.reformat(frame, width=dw, height=dh, format=_DISPLAY_PIX_FMT)
+        else:
+            rgb = frame.reformat(width=dw, height=dh, format=_DISPLAY_PIX_FMT)
+        # Wrap swscale's output plane in place using its padded line
+        # stride; to_ndarray() would repack it into a new array.
+        plane = rgb.planes[0]
+        return FrameImage(plane, rgb.width, rgb.height, plane.line_size, QImage.Format.Format_RGB32)
+
+    def _open_input(self, url: str, opts: Dict[str, str]) -> Any:
+        """
+        Open the stream with the preferred hardware device, or in software.
+        Device creation happens inside av.open, so when that fails the URL is
+        retried once in software. If software opens it, the device is at fault
+        and is dropped for later reconnects, which try the next one; if not,
+        the error is the stream's and is raised with the device kept.
+        """
+        if not self._hw_devices:
+            return av.open(url, options=opts, timeout=5.0)
+        device = self._hw_devices[0]
+        try:
+            hwaccel = HWAccel(device_type=device, allow_software_fallback=True)
+            return av.open(url, options=opts, timeout=5.0, hwaccel=hwaccel)
+        except Exception:
+            if self._stop.is_set():
+                raise
+        container = av.open(url, options=opts, timeout=5.0)
+        self._hw_devices.pop(0)
+        self.status.emit(f"Hardware decoding ({device}) unavailable; using software")
+        return container
 
     def save_snapshot(self, path: str) -> bool:
-        if self._last_qimage is None:
+        frame = self._last_frame
+        if frame is None:
+            return False
+        # Displayed frames are downscaled; convert the source frame at full resolution.
+        # Runs on a pool thread, where an escaping exception would abort the app.
+        try:
+            img = frame.to_ndarray(format="rgb24")
+            h, w, _ = img.shape
+            return FrameImage(img, w, h, img.strides[0], QImage.Format.Format_RGB888).save(path)
+        except Exception:
             return False
-        return self._last_qimage.save(path)
     
     def start_recording(self, path: str) -> bool:
         """Start recording to MKV file. Returns True if successfully started."""
@@ -117,16 +312,22 @@ class VideoWorker(QObject):
             "stimeout": str(5_000_000),
             "max_delay": str(max(0, latency_ms) * 1000),
         }
+        # One reformatter per output size keeps libswscale's scaling context
+        # (and its filter tables) cached across frames; VideoFrame.reformat()
+        # would build a fresh one for every frame, as would one reformatter
+        # alternating between sizes.
+        reformatters: Dict[Tuple[int, int], Any] = {}
 
         while not self._stop.is_set():
             try:
                 self.status.emit("Connecting…")
-                with av.open(url, options=opts, timeout=5.0) as container:
+                with self._open_input(url, opts) as container:
                     stream = next((s for s in container.streams if s.type == "video"), None)
                     if stream is None:
                         self.status.emit("No video stream found")
                         break
-                    stream.thread_type = "AUTO"
+                    stream.codec_context.thread_count = DECODER_THREADS
+                    stream.codec_context.thread_type = DECODER_THREAD_TYPE
                     
                     # Removed the line to skip non-keyframes for a smoother stream.
                     # try:
@@ -180,13 +381,17 @@ class VideoWorker(QObject):
                                 except Exception as e:
                                     self.status.emit(f"Recording error: {e}")
                         
-                        # Convert frame to RGB and keep a copy for display
-                        img = frame.to_ndarray(format="rgb24")
-                        h, w, _ = img.shape
-                        qimg = QImage(img.data, w, h, 3 * w, QImage.Format.Format_RGB888)
-                        qimg = qimg.copy()
-                        self._last_qimage = qimg
-                        self.frame_ready.emit(qimg)
+                        # Scale and convert to 32-bit RGB with libswscale here rather
+                        # than in the GUI thread, once per distinct display size
+                        sizes = self._display_sizes(frame.width, frame.height)
+                        if reformatters.keys() - set(sizes):  # drop contexts for old sizes
+                            reformatters = {k: v for k, v in reformatters.items() if k in sizes}
+                        scaled: Dict[Tuple[int, int], QImage] = {}
+                        for size in sizes:
+                            if size not in scaled:
+                                scaled[size] = self._to_display_image(frame, size, reformatters)
+                        self._last_frame = frame
+                        self._publish_frame(tuple(scaled[size] for size in sizes))
                 
                 # Flush encoder if recording
                 with self._recording_lock:
@@ -200,17 +405,17 @@ class VideoWorker(QObject):
                 if self._stop.is_set():
                     break
                 self.status.emit("Stream ended, reconnecting in 2s…")
-                time.sleep(2)
+                self._stop.wait(2)
             except AvError as e:
                 if self._stop.is_set():
                     break
                 self.status.emit(f"FFmpeg/PyAV error: {e}; retrying in 2s…")
-                time.sleep(2)
+                self._stop.wait(2)
             except Exception as e:
                 if self._stop.is_set():
                     break
                 self.status.emit(f"Error: {e}; retrying in 2s…")
-                time.sleep(2)
+                self._stop.wait(2)
         
         # Clean up recording on exit
         self.stop_recording()
@@ -221,8 +426,113 @@ class VideoWorker(QObject):
 # Widget Classes (from widgets.py)
 # ============================================================================
 
+# QOpenGLWidget ships with PyQt6 but may be missing from trimmed builds.
+# Only imported when enabled, so default startup never loads the GL libraries.
+QOpenGLWidget = None
+if OPENGL_VIDEO:
+    try:
+        from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+    except Exception:
+        QOpenGLWidget = None
+
+_SurfaceBase = QOpenGLWidget if OPENGL_VIDEO and QOpenGLWidget is not None else QWidget
+_GL_SURFACE = _SurfaceBase is not QWidget
+
+# Formats the raster engine blits without a per-pixel conversion
+_NATIVE_IMAGE_FORMATS = (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32_Premultiplied)
+
+
+class VideoSurface(_SurfaceBase):
+    """
+    Paints the latest frame letterboxed on black straight from its QImage.
+    Unlike QLabel.setPixmap this needs no per-frame QPixmap allocation or
+    conversion; the raster engine blits the RGB32 image directly. With
+    OPENGL_VIDEO the same painting goes through QPainter's OpenGL engine,
+    which uploads the frame as a texture and scales it on the GPU.
+    """
+
+    def __init__(self, placeholder: str = "", parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._image: Optional[QImage] = None
+        self._placeholder = placeholder
+        # Live frames that need rescaling are drawn with nearest-neighbour;
+        # once frames stop for a moment the last one is redrawn smoothly.
+        self._idle = False
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(200)
+        self._idle_timer.timeout.connect(self._on_idle)
+        # Letterbox rect for the current frame size; the source resolution is
+        # steady, so it is only recomputed when that or the widget size changes.
+        self._src_size = QSize()
+        self._dst_rect = QRect()
+        # Every pixel is painted in paintEvent; skip Qt's background erase
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+
+    def set_image(self, qimg: QImage):
+        if qimg.format() not in _NATIVE_IMAGE_FORMATS:
+            # Convert on arrival rather than on every repaint of the same frame
+            qimg = qimg.convertToFormat(QImage.Format.Format_RGB32)
+        had_image, self._image = self._image is not None, qimg
+        self._idle = False
+        self._idle_timer.start()
+        if had_image and qimg.size() == self._src_size:
+            # Same letterbox as the previous frame: the bars are unchanged
+            self.update(self._dst_rect)
+        else:
+            self._src_size = qimg.size()
+            self._update_dst_rect()
+            self.update()
+
+    def _update_dst_rect(self):
+        self._dst_rect.setSize(self._src_size.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio))
+        self._dst_rect.moveCenter(self.rect().center())
+
+    def _on_idle(self):
+        self._idle = True
+        self.update(self._dst_rect)
+
+    def paintEvent(self, e):
+        if _GL_SURFACE:
+            super().paintEvent(e)  # QOpenGLWidget calls paintGL()
+            return
+        self._paint(e.rect())
+
+    def paintGL(self):
+        """Paint into the GL framebuffer, which is redrawn whole every time."""
+        self._paint(self.rect())
+
+    def _paint(self, exposed: QRect):
+        painter = QPainter(self)
+        if (self._image is None or self._image.hasAlphaChannel()
+                or not self._dst_rect.contains(exposed)):
+            # Full or exposure repaint; per-frame updates only cover the opaque image
+            painter.fillRect(self.rect(), Qt.GlobalColor.black)
+        if self._image is None:
+            if self._placeholder:
+                painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+                painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._placeholder)
+        else:
+            src, dst = self._src_size, self._dst_rect
+            if dst.size() == src:
+                # Worker already scaled to this box: plain blit, no transform
+                painter.drawImage(dst.topLeft(), self._image)
+            else:
+                # Nearest-neighbour is only for live frames; any scaled still is
+                # filtered. Texture sampling makes filtering free on the GL path.
+                if self._idle or _GL_SURFACE:
+                    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+                painter.drawImage(dst, self._image)
+        painter.end()
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._update_dst_rect()
+
+
 class VideoPane(QFrame):
     clicked = pyqtSignal(int)
+    target_changed = pyqtSignal()  # video area resized; frames should be scaled to the new size
 
     def __init__(
         self,
@@ -235,21 +545,20 @@ class VideoPane(QFrame):
         self.index = index
         # --- MODIFIED: Removed object name, will style based on class ---
         self.setFrameShape(QFrame.Shape.StyledPanel)
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
         # --- MODIFIED: Removed inline stylesheet ---
-        self._last_pix: Optional[QPixmap] = None
         self._target_size = target_size
         self._scale = scale
+        self._size_hint: Optional[QSize] = None  # cached; see event()
 
         self.title = QLabel(title or f"Feed {index+1}")
         # --- MODIFIED: Added object name for specific styling ---
         self.title.setObjectName("pane_title")
 
-        self.video_lbl = QLabel()
+        self.video_lbl = VideoSurface("No video")
         # --- MODIFIED: Added object name for specific styling ---
         self.video_lbl.setObjectName("video_lbl")
-        self.video_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_lbl.setText("No video")
         self.video_lbl.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.video_lbl.setMinimumSize(self._target_size)
 
@@ -257,34 +566,46 @@ class VideoPane(QFrame):
         v.setContentsMargins(0, 0, 0, 0)
         v.setSpacing(max(0, int(4 * self._scale)))
         v.addWidget(self.title)
-        wrap = QHBoxLayout()
-        wrap.setContentsMargins(0, 0, 0, 0)
-        wrap.setSpacing(0)
-        wrap.addWidget(self.video_lbl, 1)
-        v.addLayout(wrap, 1)
+        # The surface letterboxes itself, so it just takes the remaining space
+        v.addWidget(self.video_lbl, 1)
 
     def sizeHint(self) -> QSize:
         # Manually calculate hint based on layout to be safe
-        title_h = self.title.sizeHint().height()
-        return QSize(self._target_size.width(), self._target_size.height() + title_h)
+        if self._size_hint is None:
+            title_h = self.title.sizeHint().height()
+            self._size_hint = QSize(self._target_size.width(), self._target_size.height() + title_h)
+        return self._size_hint
+
+    def event(self, e):
+        # A child's size hint changed (e.g. the title font after styling)
+        if e.type() == QEvent.Type.LayoutRequest:
+            self._size_hint = None
+        return super().event(e)
 
     def set_active(self, active: bool):
         """
         --- MODIFIED: Uses properties instead of stylesheets ---
         Sets a property on the widget which the main stylesheet can use
-        to change its appearance (e.g., border color).
+        to change its appearance (e.g., border color). Panes whose flag is
+        unchanged are left alone, so a panel switch re-polishes two panes.
         """
+        if self.property("active") == active:
+            return
         self.setProperty("active", active)
-        # Re-polish the widget to force a style update
-        self.style().unpolish(self)
+        # Only the frame border and the title depend on the property; polish()
+        # re-resolves their rules without an unpolish round-trip, and the
+        # video label is left untouched.
         self.style().polish(self)
+        self.title.style().polish(self.title)
+        self.update()
 
     def on_frame(self, qimg: QImage):
         if qimg.isNull(): return
-        pm = QPixmap.fromImage(qimg)
-        if pm.isNull(): return
-        self._last_pix = pm
-        self._update_pixmap()
+        # Hidden or fully clipped panes skip the frame; the next one after
+        # they reappear repaints them
+        if not self.isVisible() or self.video_lbl.visibleRegion().isEmpty():
+            return
+        self.video_lbl.set_image(qimg)
 
     def mousePressEvent(self, e):
         if e.button() == Qt.MouseButton.LeftButton:
@@ -293,23 +614,12 @@ class VideoPane(QFrame):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._update_pixmap()
-
-    def _update_pixmap(self):
-        if not self._last_pix:
-            return
-        target = self.video_lbl.size()
-        if target.width() <= 0 or target.height() <= 0:
-            return
-        scaled = self._last_pix.scaled(
-            target,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.video_lbl.setPixmap(scaled)
+        self.target_changed.emit()
 
 
 class FullscreenVideo(QWidget):
+    target_changed = pyqtSignal()  # shown, hidden or resized
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setWindowTitle("RTSP — Fullscreen")
@@ -318,30 +628,23 @@ class FullscreenVideo(QWidget):
         # This simple style is fine to keep here
         self.setStyleSheet("background:black;")
 
-        self.video_lbl = QLabel(self)
-        self.video_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.video_lbl = VideoSurface(parent=self)
 
         lay = QVBoxLayout(self)
         lay.setContentsMargins(0, 0, 0, 0)
         lay.addWidget(self.video_lbl)
 
-        self._cursor_hidden = False
-
-    def _target_size(self) -> QSize:
-        return self.size()
+        # Hide the pointer only over this window; children inherit it
+        self.setCursor(QCursor(Qt.CursorShape.BlankCursor))
 
     def on_frame(self, qimg: QImage):
         if not self.isVisible() or qimg.isNull():
             return
-        pm = QPixmap.fromImage(qimg)
-        if pm.isNull():
-            return
-        scaled = pm.scaled(
-            self._target_size(), 
-            Qt.AspectRatioMode.KeepAspectRatio, 
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.video_lbl.setPixmap(scaled)
+        self.video_lbl.set_image(qimg)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self.target_changed.emit()
 
     def keyPressEvent(self, e):
         if e.key() in (Qt.Key.Key_Escape, Qt.Key.Key_F11, Qt.Key.Key_Q):
@@ -355,26 +658,236 @@ class FullscreenVideo(QWidget):
         e.accept()
 
     def showEvent(self, e):
-        if not self._cursor_hidden:
-            QApplication.setOverrideCursor(QCursor(Qt.CursorShape.BlankCursor))
-            self._cursor_hidden = True
         super().showEvent(e)
+        self.target_changed.emit()
 
     def hideEvent(self, e):
-        if self._cursor_hidden:
-            QApplication.restoreOverrideCursor()
-            self._cursor_hidden = False
         super().hideEvent(e)
+        self.target_changed.emit()
 
 
 # ============================================================================
 # Main Application Window (from main_window.py)
 # ============================================================================
 
+# Application stylesheet. Parsed once at import; _apply_modern_stylesheet
+# fills in the scale-dependent metrics with str.format.
+_STYLESHEET_TEMPLATE = """
+    /* GENERAL */
+    RtspApp, FullscreenVideo {{
+        background-color: #202124; /* Very dark grey background */
+    }}
+    QLabel {{
+        color: #e8eaed; /* Light grey text */
+    }}
+
+    /* CONTROLS WIDGET (LEFT PANE) */
+    QWidget#controls_widget {{
+        background-color: #2d2e30;
+        border-radius: {pane_radius}px;
+    }}
+    QWidget#controls_widget QLabel {{
+        font-size: {controls_label_font}pt;
+    }}
+    QWidget#controls_widget QLabel b {{
+        font-size: {controls_heading_font}pt;
+    }}
+
+    /* INPUT WIDGETS */
+    QLineEdit, QSpinBox, QComboBox {{
+        background-color: #3c3d3f;
+        color: #e8eaed;
+        border: 1px solid #5f6368;
+        border-radius: {input_radius}px;
+        padding: {input_padding}px;
+        font-size: {controls_label_font}pt;
+    }}
+    QLineEdit:focus, QSpinBox:focus, QComboBox:focus {{
+        border: 1px solid #8ab4f8; /* Google blue for focus */
+    }}
+    QLineEdit[readOnly="true"] {{
+        background-color: #202124;
+        color: #9aa0a6;
+    }}
+    QSpinBox::up-button, QSpinBox::down-button {{
+        width: {spin_button_width}px;
+    }}
+
+    /* --- FIX FOR COMBOBOX DROPDOWN --- */
+    QComboBox::drop-down {{
+        border: none;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: #3c3d3f; /* Dark background for the list */
+        color: #e8eaed; /* Light text for items */
+        selection-background-color: #8ab4f8; /* Blue for selected item */
+        selection-color: #202124; /* Dark text for selected item */
+        border: 1px solid #5f6368;
+        border-radius: {input_radius}px;
+        outline: 0px; /* Remove focus outline */
+    }}
+    /* --- END FIX --- */
+
+    /* BUTTONS */
+    QPushButton {{
+        background-color: #5f6368;
+        color: #e8eaed;
+        border: none;
+        border-radius: {button_radius}px;
+        padding: {button_pad_v}px {button_pad_h}px;
+        font-size: {controls_label_font}pt;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: #70757a;
+    }}
+    QPushButton:pressed {{
+        background-color: #505357;
+    }}
+    QPushButton:disabled {{
+        background-color: #3c3d3f;
+        color: #70757a;
+    }}
+
+    /* PRIMARY ACTION BUTTONS */
+    QPushButton#start_btn, QPushButton#start_all_btn {{
+        background-color: #8ab4f8;
+        color: #202124;
+    }}
+    QPushButton#start_btn:hover, QPushButton#start_all_btn:hover {{
+        background-color: #a1c3fb;
+    }}
+
+    /* DESTRUCTIVE ACTION BUTTONS */
+    QPushButton#stop_btn:hover, QPushButton#stop_all_btn:hover {{
+        background-color: #f28b82; /* Google red for stop hover */
+        color: #202124;
+    }}
+    
+    /* RECORDING BUTTON - RED WHEN ACTIVE */
+    QPushButton#record_btn[recording="true"] {{
+        background-color: #ea4335; /* Google red for recording */
+        color: #ffffff;
+    }}
+    QPushButton#record_btn[recording="true"]:hover {{
+        background-color: #f28b82;
+    }}
+
+    /* VIDEO PANE STYLING */
+    VideoPane {{
+        background-color: #2d2e30;
+        border: 2px solid #3c3d3f;
+        border-radius: {pane_radius}px;
+    }}
+    VideoPane[active="true"] {{
+        border: 2px solid #8ab4f8;
+    }}
+
+    QLabel#pane_title {{
+        font-size: {pane_title_font}pt;
+        font-weight: bold;
+        color: #bdc1c6;
+        padding: {pane_title_padding_v}px {pane_title_padding_h}px;
+        background-color: transparent;
+    }}
+
+    VideoPane[active="true"] QLabel#pane_title {{
+        color: #202124;
+        background-color: #8ab4f8;
+        border-top-left-radius: {pane_title_radius}px; /* Match parent radius */
+        border-top-right-radius: {pane_title_radius}px;
+    }}
+
+    VideoSurface#video_lbl {{
+        color: #5f6368;
+    }}
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def _format_rtsp_url(user: str, pwd: str, ip: str, port: int, slug: str, channel: str, subtype: str) -> str:
+    """Assemble an RTSP URL; memoized since the same panel settings are formatted repeatedly."""
+    if not ip: return ""
+    if not slug.startswith("/"): slug = "/" + slug
+
+    cred = ""
+    if user:
+        cred_pass = f":{pwd}" if pwd else ""
+        cred = f"{user}{cred_pass}@"
+
+    return _RTSP_URL_FORMAT({
+        "cred": cred, "ip": ip, "port": port, "slug": slug,
+        "channel": channel, "subtype": subtype,
+    })
+
+
+def _read_json_file(path: str) -> Any:
+    """Read and parse a JSON file with Qt, returning plain Python objects."""
+    f = QFile(path)
+    if not f.open(QIODevice.OpenModeFlag.ReadOnly):
+        raise OSError(f.errorString())
+    try:
+        err = QJsonParseError()
+        doc = QJsonDocument.fromJson(f.readAll(), err)
+    finally:
+        f.close()
+    if doc.isNull():
+        raise ValueError(err.errorString())
+    return doc.toVariant()
+
+
+def _write_json_file(path: str, doc: QJsonDocument):
+    """Write a JSON document to path as indented text."""
+    f = QFile(path)
+    if not f.open(QIODevice.OpenModeFlag.WriteOnly | QIODevice.OpenModeFlag.Truncate):
+        raise OSError(f.errorString())
+    try:
+        if f.write(doc.toJson(QJsonDocument.JsonFormat.Indented)) < 0:
+            raise OSError(f.errorString())
+    finally:
+        f.close()
+
+
+class ConfigIOTask(QRunnable):
+    """Run a config file read/write on the thread pool and report through a window signal."""
+
+    def __init__(self, path: str, io_fn: Callable[[str], Any], finished: Any):
+        super().__init__()
+        self._path = path
+        self._io_fn = io_fn
+        self._finished = finished  # bound pyqtSignal(str, object, str) on the receiving window
+
+    def run(self):
+        try:
+            result = self._io_fn(self._path)
+        except Exception as e:
+            self._finished.emit(self._path, None, str(e) or type(e).__name__)
+        else:
+            self._finished.emit(self._path, result, "")
+
+
+class StreamState(enum.IntEnum):
+    """Per-panel stream lifecycle.
+
+    DRAINING: the worker was asked to stop and a restart follows its `stopped` signal.
+    WAKING: the drain finished and the restart is queued on the event loop.
+    """
+    IDLE = 0
+    WAKING = 1
+    RUNNING = 2
+    DRAINING = 3
+
+
 class RtspApp(QWidget):
+    snapshot_finished = pyqtSignal(str, bool)  # path, saved successfully
+    config_saved = pyqtSignal(str, object, str)  # path, unused, error ("" on success)
+    config_loaded = pyqtSignal(str, object, str)  # path, parsed JSON, error ("" on success)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("RTSP Viewer")
+        # Let the stylesheet paint this QWidget subclass's background
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
         self._scale = self._calculate_scale()
         self._pane_target = QSize(
@@ -402,8 +915,28 @@ class RtspApp(QWidget):
                 "running": False, "recording": False, "title": f"Feed {i + 1}",
             } for i in range(4)
         ]
-        self.workers: List[VideoWorker] = [VideoWorker() for _ in range(4)]
+        self.workers: List[VideoWorker] = [VideoWorker(f"panel{i + 1}") for i in range(4)]
+        self.stream_states: List[StreamState] = [StreamState.IDLE] * 4
         self.active_index: int = 0
+        # Scratch state reused by update_preview so typing doesn't allocate per keystroke
+        self._preview_state: Dict[str, Any] = {}
+        # Coalesces bursts of form edits into one preview refresh
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self.update_preview)
+        # Channel/subtype changes bounce the stream only after edits settle,
+        # so wheel-scrolling a combo doesn't reconnect on every index
+        self._restart_timer = QTimer(self)
+        self._restart_timer.setSingleShot(True)
+        self._restart_timer.setInterval(400)
+        self._restart_timer.timeout.connect(self._do_restart_active)
+        # Latest status message per panel, applied to labels at most every 100 ms
+        self._status_queue: Dict[int, str] = {}
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status)
 
         # UI Initialization
         self._init_ui()
@@ -412,13 +945,26 @@ class RtspApp(QWidget):
 
         # Connect workers to panes
         for i, worker in enumerate(self.workers):
-            worker.frame_ready.connect(self.panes[i].on_frame)
             worker.status.connect(self._make_status_updater(i))
             worker.recording_status.connect(self._make_recording_status_updater(i))
+            worker.stopped.connect(functools.partial(self._on_worker_stopped, i))
+        self.snapshot_finished.connect(self._on_snapshot_finished)
+        self.config_saved.connect(self._on_config_saved)
+        self.config_loaded.connect(self._on_config_loaded)
 
         # Fullscreen window (initially hidden)
         self.fullwin = FullscreenVideo()
         self._fullscreen_source_index: Optional[int] = None
+        for i in range(4):
+            self.panes[i].target_changed.connect(functools.partial(self._refresh_worker_target, i))
+        self.fullwin.target_changed.connect(self._on_fullscreen_target_changed)
+
+        # Pull model: one timer tick presents the newest frame of every stream,
+        # decoupling decode rate from display rate. It only runs while a
+        # stream is up (see _ensure_presenting).
+        self._present_timer = QTimer(self)
+        self._present_timer.setInterval(max(1, 1000 // DISPLAY_FPS))
+        self._present_timer.timeout.connect(self._present_frames)
         
         # Explicitly initialize the UI for the first panel
         self._sync_ui_from_state()
@@ -458,138 +1004,21 @@ class RtspApp(QWidget):
         pane_title_radius = max(4, round(6 * self._scale))
         spin_button_width = max(14, round(18 * self._scale))
 
-        stylesheet = f"""
-            /* GENERAL */
-            RtspApp, FullscreenVideo {{
-                background-color: #202124; /* Very dark grey background */
-            }}
-            QLabel {{
-                color: #e8eaed; /* Light grey text */
-            }}
-
-            /* CONTROLS WIDGET (LEFT PANE) */
-            QWidget#controls_widget {{
-                background-color: #2d2e30;
-                border-radius: {pane_radius}px;
-            }}
-            QWidget#controls_widget QLabel {{
-                font-size: {controls_label_font}pt;
-            }}
-            QWidget#controls_widget QLabel b {{
-                font-size: {controls_heading_font}pt;
-            }}
-
-            /* INPUT WIDGETS */
-            QLineEdit, QSpinBox, QComboBox {{
-                background-color: #3c3d3f;
-                color: #e8eaed;
-                border: 1px solid #5f6368;
-                border-radius: {input_radius}px;
-                padding: {input_padding}px;
-                font-size: {controls_label_font}pt;
-            }}
-            QLineEdit:focus, QSpinBox:focus, QComboBox:focus {{
-                border: 1px solid #8ab4f8; /* Google blue for focus */
-            }}
-            QLineEdit[readOnly="true"] {{
-                background-color: #202124;
-                color: #9aa0a6;
-            }}
-            QSpinBox::up-button, QSpinBox::down-button {{
-                width: {spin_button_width}px;
-            }}
-
-            /* --- FIX FOR COMBOBOX DROPDOWN --- */
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: #3c3d3f; /* Dark background for the list */
-                color: #e8eaed; /* Light text for items */
-                selection-background-color: #8ab4f8; /* Blue for selected item */
-                selection-color: #202124; /* Dark text for selected item */
-                border: 1px solid #5f6368;
-                border-radius: {input_radius}px;
-                outline: 0px; /* Remove focus outline */
-            }}
-            /* --- END FIX --- */
-
-            /* BUTTONS */
-            QPushButton {{
-                background-color: #5f6368;
-                color: #e8eaed;
-                border: none;
-                border-radius: {button_radius}px;
-                padding: {button_pad_v}px {button_pad_h}px;
-                font-size: {controls_label_font}pt;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #70757a;
-            }}
-            QPushButton:pressed {{
-                background-color: #505357;
-            }}
-            QPushButton:disabled {{
-                background-color: #3c3d3f;
-                color: #70757a;
-            }}
-
-            /* PRIMARY ACTION BUTTONS */
-            QPushButton#start_btn, QPushButton#start_all_btn {{
-                background-color: #8ab4f8;
-                color: #202124;
-            }}
-            QPushButton#start_btn:hover, QPushButton#start_all_btn:hover {{
-                background-color: #a1c3fb;
-            }}
-
-            /* DESTRUCTIVE ACTION BUTTONS */
-            QPushButton#stop_btn:hover, QPushButton#stop_all_btn:hover {{
-                background-color: #f28b82; /* Google red for stop hover */
-                color: #202124;
-            }}
-            
-            /* RECORDING BUTTON - RED WHEN ACTIVE */
-            QPushButton#record_btn[recording="true"] {{
-                background-color: #ea4335; /* Google red for recording */
-                color: #ffffff;
-            }}
-            QPushButton#record_btn[recording="true"]:hover {{
-                background-color: #f28b82;
-            }}
-
-            /* VIDEO PANE STYLING */
-            VideoPane {{
-                background-color: #2d2e30;
-                border: 2px solid #3c3d3f;
-                border-radius: {pane_radius}px;
-            }}
-            VideoPane[active="true"] {{
-                border: 2px solid #8ab4f8;
-            }}
-
-            QLabel#pane_title {{
-                font-size: {max(8, round(9 * self._scale))}pt;
-                font-weight: bold;
-                color: #bdc1c6;
-                padding: {pane_title_padding_v}px {pane_title_padding_h}px;
-                background-color: transparent;
-            }}
-
-            VideoPane[active="true"] QLabel#pane_title {{
-                color: #202124;
-                background-color: #8ab4f8;
-                border-top-left-radius: {pane_title_radius}px; /* Match parent radius */
-                border-top-right-radius: {pane_title_radius}px;
-            }}
-
-            QLabel#video_lbl {{
-                background-color: #000000;
-                color: #5f6368;
-            }}
-        """
-        self.setStyleSheet(stylesheet)
+        self.setStyleSheet(_STYLESHEET_TEMPLATE.format(
+            controls_label_font=controls_label_font,
+            controls_heading_font=controls_heading_font,
+            input_radius=input_radius,
+            input_padding=input_padding,
+            button_radius=button_radius,
+            button_pad_v=button_pad_v,
+            button_pad_h=button_pad_h,
+            pane_radius=pane_radius,
+            pane_title_font=max(8, round(9 * self._scale)),
+            pane_title_padding_v=pane_title_padding_v,
+            pane_title_padding_h=pane_title_padding_h,
+            pane_title_radius=pane_title_radius,
+            spin_button_width=spin_button_width,
+        ))
 
     def _build_combo(self, items: List[str]) -> QComboBox:
         combo = QComboBox(self)
@@ -636,10 +1065,14 @@ class RtspApp(QWidget):
         self.port_spin.setRange(1, 65535)
         self.slug_edit = QLineEdit(self)
         
-        self.channel_combo = self._build_combo([str(i) for i in range(1, 17)])
-        self.subtype_combo = self._build_combo(["0", "1", "2"])
-
-        self.transport_combo = self._build_combo(["tcp", "udp"])
+        self.channel_combo = self._build_combo(list(_CHANNEL_ITEMS))
+        self.subtype_combo = self._build_combo(list(_SUBTYPE_ITEMS))
+
+        self.transport_combo = self._build_combo(list(_TRANSPORTS))
+        # Value -> index lookups so syncing a panel avoids findText model scans
+        self._channel_idx = {v: i for i, v in enumerate(_CHANNEL_ITEMS)}
+        self._subtype_idx = {v: i for i, v in enumerate(_SUBTYPE_ITEMS)}
+        self._transport_idx = {v: i for i, v in enumerate(_TRANSPORTS)}
         self.latency_spin = QSpinBox(self)
         self.latency_spin.setRange(0, 5000)
         self.latency_spin.setSuffix(" ms")
@@ -763,10 +1196,10 @@ class RtspApp(QWidget):
             p.clicked.connect(self.set_active_panel)
 
         for w in (self.title_edit, self.user_edit, self.pass_edit, self.ip_edit, self.slug_edit):
-            w.textChanged.connect(self.update_preview)
+            w.textChanged.connect(self._schedule_preview)
         for w in (self.port_spin, self.latency_spin):
-            w.valueChanged.connect(self.update_preview)
-        self.transport_combo.currentIndexChanged.connect(self.update_preview)
+            w.valueChanged.connect(self._schedule_preview)
+        self.transport_combo.currentIndexChanged.connect(self._schedule_preview)
 
         for w in (self.channel_combo, self.subtype_combo):
             w.currentIndexChanged.connect(self._handle_stream_parameter_change)
@@ -782,23 +1215,11 @@ class RtspApp(QWidget):
         self.load_cfg_btn.clicked.connect(self.load_config)
 
     def build_url_from_state(self, st: Dict[str, Any], include_password: bool = True) -> str:
-        user = st.get("user", "")
-        pwd = st.get("pass", "")
-        ip = st.get("ip", "")
-        port = st.get("port", 554)
-        slug = st.get("slug", "")
-        channel = st.get("channel", "1")
-        subtype = st.get("subtype", "0")
-
-        if not ip: return ""
-        if not slug.startswith("/"): slug = "/" + slug
-
-        cred = ""
-        if user:
-            cred_pass = f":{pwd}" if pwd and include_password else ""
-            cred = f"{user}{cred_pass}@"
-
-        return f"rtsp://{cred}{ip}:{port}{slug}?channel={channel}&subtype={subtype}"
+        return _format_rtsp_url(
+            st.get("user", ""), st.get("pass", "") if include_password else "",
+            st.get("ip", ""), st.get("port", 554), st.get("slug", ""),
+            st.get("channel", "1"), st.get("subtype", "0"),
+        )
 
     def _sync_ui_from_state(self):
         st = self.panel_states[self.active_index]
@@ -812,9 +1233,9 @@ class RtspApp(QWidget):
             self.ip_edit.setText(st["ip"])
             self.port_spin.setValue(st["port"])
             self.slug_edit.setText(st["slug"])
-            self._set_combo_value(self.channel_combo, st["channel"])
-            self._set_combo_value(self.subtype_combo, st["subtype"])
-            self._set_combo_value(self.transport_combo, st["transport"])
+            self._set_combo_value(self.channel_combo, st["channel"], self._channel_idx)
+            self._set_combo_value(self.subtype_combo, st["subtype"], self._subtype_idx)
+            self._set_combo_value(self.transport_combo, st["transport"], self._transport_idx)
             self.latency_spin.setValue(st["latency"])
         finally:
             self.channel_combo.blockSignals(False)
@@ -823,43 +1244,91 @@ class RtspApp(QWidget):
         self._update_buttons_enabled()
         self.update_preview()
 
-    def _sync_state_from_ui(self):
-        st = self.panel_states[self.active_index]
+    def _sync_state_from_ui(self, persist: bool = True) -> Dict[str, Any]:
+        """
+        Copy the form into the active panel state and return it. With
+        persist=False the values go into a reusable scratch dict instead,
+        leaving panel state and the pane title untouched.
+        """
+        st = self.panel_states[self.active_index] if persist else self._preview_state
         st["title"] = self.title_edit.text()
         st["user"] = self.user_edit.text()
         st["pass"] = self.pass_edit.text()
         st["ip"] = self.ip_edit.text()
         st["port"] = self.port_spin.value()
         st["slug"] = self.slug_edit.text()
-        st["channel"] = self.channel_combo.currentText()
-        st["subtype"] = self.subtype_combo.currentText()
-        st["transport"] = self.transport_combo.currentText()
+        st["channel"] = sys.intern(self.channel_combo.currentText())
+        st["subtype"] = sys.intern(self.subtype_combo.currentText())
+        st["transport"] = sys.intern(self.transport_combo.currentText())
         st["latency"] = self.latency_spin.value()
-        self.panes[self.active_index].title.setText(st["title"])
+        if persist:
+            self.panes[self.active_index].title.setText(st["title"])
+        return st
+
+    def _set_combo_value(self, combo: QComboBox, value: str, idx_map: Dict[str, int]):
+        combo.setCurrentIndex(idx_map.get(str(value), 0))
 
-    def _set_combo_value(self, combo: QComboBox, value: str):
-        idx = combo.findText(str(value))
-        combo.setCurrentIndex(idx if idx >= 0 else 0)
+    def _schedule_preview(self, _=None):
+        """Restart the debounce timer; the preview refreshes once edits pause."""
+        self._preview_timer.start()
 
     def update_preview(self):
-        temp_state = {
-            "user": self.user_edit.text(), "pass": self.pass_edit.text(),
-            "ip": self.ip_edit.text(), "port": self.port_spin.value(),
-            "slug": self.slug_edit.text(), "channel": self.channel_combo.currentText(),
-            "subtype": self.subtype_combo.currentText(),
-        }
-        url = self.build_url_from_state(temp_state, include_password=False)
+        st = self._sync_state_from_ui(persist=False)
+        url = self.build_url_from_state(st, include_password=False)
         self.url_preview.setText(url)
         self.url_preview.setCursorPosition(0)
 
     def _handle_stream_parameter_change(self, _=None):
         self.update_preview()
-        if self.panel_states[self.active_index].get("running", False):
-            self.stop_stream()
-            self.start_stream()
+        if self.stream_states[self.active_index] != StreamState.IDLE:
+            self._restart_timer.start()
+
+    def _do_restart_active(self):
+        """Restart the active panel's stream with the settled form parameters."""
+        idx = self.active_index
+        if self.stream_states[idx] != StreamState.RUNNING:
+            # IDLE needs no restart; DRAINING/WAKING will pick up the new
+            # parameters when the pending restart runs.
+            return
+        self._sync_state_from_ui()
+        worker = self.workers[idx]
+        if worker.is_active():
+            self.stream_states[idx] = StreamState.DRAINING
+            worker.request_stop()
+        else:
+            self.stream_states[idx] = StreamState.WAKING
+            QTimer.singleShot(0, functools.partial(self._advance_state, idx))
+
+    def _on_worker_stopped(self, idx: int):
+        """Queue the restart of a draining panel once its decode thread has exited."""
+        if self.stream_states[idx] == StreamState.DRAINING:
+            self.stream_states[idx] = StreamState.WAKING
+            QTimer.singleShot(0, functools.partial(self._advance_state, idx))
+
+    def _advance_state(self, idx: int):
+        """Start the worker of a panel that finished draining."""
+        if self.stream_states[idx] != StreamState.WAKING:
+            return
+        if idx == self.active_index:
+            self._sync_state_from_ui()  # include edits made while draining
+        st = self.panel_states[idx]
+        url = self.build_url_from_state(st)
+        if not url:
+            self.stream_states[idx] = StreamState.IDLE
+            st["running"] = False
+            if idx == self.active_index:
+                self._update_buttons_enabled()
+            return
+        self.workers[idx].start(url, st["transport"], st["latency"])
+        self.stream_states[idx] = StreamState.RUNNING
+        self._ensure_presenting()
 
     def set_active_panel(self, index: int):
         if not (0 <= index < 4) or index == self.active_index: return
+        if self._restart_timer.isActive():
+            # Apply a pending restart to the panel it was scheduled for
+            self._restart_timer.stop()
+            self._do_restart_active()
         self._sync_state_from_ui()
         self.active_index = index
         self._sync_ui_from_state()
@@ -872,6 +1341,8 @@ class RtspApp(QWidget):
             p.set_active(i == self.active_index)
 
     def start_stream(self):
+        if self.stream_states[self.active_index] != StreamState.IDLE:
+            return
         self._sync_state_from_ui()
         st = self.panel_states[self.active_index]
         url = self.build_url_from_state(st)
@@ -880,7 +1351,9 @@ class RtspApp(QWidget):
             return
         worker = self.workers[self.active_index]
         worker.start(url, st["transport"], st["latency"])
+        self.stream_states[self.active_index] = StreamState.RUNNING
         st["running"] = True
+        self._ensure_presenting()
         self._update_buttons_enabled()
 
     def stop_stream(self):
@@ -890,6 +1363,7 @@ class RtspApp(QWidget):
             worker.stop_recording()
             self.panel_states[self.active_index]["recording"] = False
         worker.stop()
+        self.stream_states[self.active_index] = StreamState.IDLE
         self.panel_states[self.active_index]["running"] = False
         self._update_buttons_enabled()
 
@@ -900,7 +1374,21 @@ class RtspApp(QWidget):
             return
         default_name = f"{st['title'].replace(' ', '_')}.jpg"
         path, _ = QFileDialog.getSaveFileName(self, "Save Snapshot", default_name, "Images (*.jpg *.png)")
-        if path and not self.workers[self.active_index].save_snapshot(path):
+        if path:
+            # Encoding a full-resolution frame is slow; keep it off the UI thread.
+            worker = self.workers[self.active_index]
+            QThreadPool.globalInstance().start(QRunnable.create(
+                lambda: self._finish_snapshot(path, worker.save_snapshot(path))
+            ))
+
+    def _finish_snapshot(self, path: str, ok: bool):
+        """Report a snapshot result from the pool thread back to the UI thread."""
+        self.snapshot_finished.emit(path, ok)
+
+    def _on_snapshot_finished(self, path: str, ok: bool):
+        if ok:
+            self.status_lbl.setText(f"Snapshot saved to {path}")
+        else:
             QMessageBox.warning(self, "Snapshot Failed", "Could not save snapshot. No frame received yet?")
     
     def toggle_recording(self):
@@ -957,19 +1445,31 @@ class RtspApp(QWidget):
         for i, st in enumerate(self.panel_states):
             if not st["running"] and st["ip"]:
                 url = self.build_url_from_state(st)
+                # start() only spawns the decode thread; the RTSP handshakes
+                # run there, so the streams still come up in parallel.
                 self.workers[i].start(url, st["transport"], st["latency"])
+                self.stream_states[i] = StreamState.RUNNING
                 st["running"] = True
+        self._ensure_presenting()
         self._update_buttons_enabled()
 
     def stop_all_streams(self):
+        stopping = []
         for i in range(4):
+            self.stream_states[i] = StreamState.IDLE
             if self.panel_states[i]["running"]:
                 # Stop recording if active
                 if self.panel_states[i].get("recording", False):
                     self.workers[i].stop_recording()
                     self.panel_states[i]["recording"] = False
-                self.workers[i].stop()
+                self.workers[i].request_stop()
+                stopping.append(self.workers[i])
                 self.panel_states[i]["running"] = False
+        # All decode threads wind down concurrently; join them against one
+        # shared deadline so the worst case is 2s, not 2s per stream.
+        deadline = time.monotonic() + 2.0
+        for worker in stopping:
+            worker.wait_stopped(deadline - time.monotonic())
         self._update_buttons_enabled()
 
     def toggle_fullscreen(self):
@@ -980,42 +1480,98 @@ class RtspApp(QWidget):
             self.fullwin.showFullScreen()
 
     def _connect_fullscreen_to(self, idx: int):
-        if self._fullscreen_source_index is not None:
-            try: self.workers[self._fullscreen_source_index].frame_ready.disconnect(self.fullwin.on_frame)
-            except TypeError: pass
-        self.workers[idx].frame_ready.connect(self.fullwin.on_frame)
+        prev = self._fullscreen_source_index
         self._fullscreen_source_index = idx
+        if prev is not None and prev != idx:
+            self._refresh_worker_target(prev)
+        self._refresh_worker_target(idx)
+
+    def _on_fullscreen_target_changed(self):
+        if self._fullscreen_source_index is not None:
+            self._refresh_worker_target(self._fullscreen_source_index)
+
+    def _refresh_worker_target(self, idx: int):
+        """Point a worker's output sizes at the pane and, if showing it, the fullscreen window."""
+        if _GL_SURFACE:
+            # Convert only; the OpenGL paint engine scales on the GPU, and the
+            # pane and fullscreen window share the one source-size image
+            self.workers[idx].set_target_sizes((0, 0))
+            return
+        pane = self.panes[idx].video_lbl.size()
+        sizes = [(pane.width(), pane.height())]
+        if idx == self._fullscreen_source_index and self.fullwin.isVisible():
+            full = self.fullwin.size()
+            sizes.append((full.width(), full.height()))
+        self.workers[idx].set_target_sizes(*sizes)
+
+    def _ensure_presenting(self):
+        """Start the presentation timer if a stream has come up."""
+        if not self._present_timer.isActive() and any(s != StreamState.IDLE for s in self.stream_states):
+            self._present_timer.start()
+
+    def _present_frames(self):
+        for i in range(4):
+            self._dispatch_frame(i)
+        if all(s == StreamState.IDLE for s in self.stream_states):
+            # Nothing left to present; stop ticking until the next start
+            self._present_timer.stop()
+
+    def _dispatch_frame(self, idx: int):
+        """Deliver a worker's newest frame to its pane and, if selected, the fullscreen window."""
+        images = self.workers[idx].take_frame()
+        if images is None:
+            return
+        self.panes[idx].on_frame(images[0])
+        # Switching the fullscreen source only changes the index, no signal rewiring
+        if idx == self._fullscreen_source_index and self.fullwin.isVisible():
+            self.fullwin.on_frame(images[-1])
 
     def save_config(self):
         self._sync_state_from_ui()
         path, _ = QFileDialog.getSaveFileName(self, "Save Configuration", "", "JSON Files (*.json)")
         if path:
-            data = {"version": 1, "panels": self.panel_states}
-            try:
-                with open(path, "w") as f: json.dump(data, f, indent=2)
-                self.status_lbl.setText(f"Configuration saved to {path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error Saving", f"Could not save config file:\n{e}")
+            # Snapshot the state here; serialization and the write run on the pool
+            doc = QJsonDocument.fromVariant({"version": 1, "panels": self.panel_states})
+            if doc.isNull():
+                self._on_config_saved(path, None, "Configuration could not be serialized to JSON.")
+                return
+            QThreadPool.globalInstance().start(ConfigIOTask(
+                path, functools.partial(_write_json_file, doc=doc), self.config_saved
+            ))
+
+    def _on_config_saved(self, path: str, _result: Any, error: str):
+        if error:
+            QMessageBox.critical(self, "Error Saving", f"Could not save config file:\n{error}")
+        else:
+            self.status_lbl.setText(f"Configuration saved to {path}")
 
     def load_config(self):
         path, _ = QFileDialog.getOpenFileName(self, "Load Configuration", "", "JSON Files (*.json)")
         if path:
-            try:
-                with open(path, "r") as f: data = json.load(f)
-                loaded_states = data.get("panels", data)
-                if isinstance(loaded_states, list) and len(loaded_states) == 4:
-                    self.stop_all_streams()
-                    self.panel_states = loaded_states
-                    for st in self.panel_states:
-                        st['running'] = False
-                    self.active_index = 0
+            QThreadPool.globalInstance().start(ConfigIOTask(path, _read_json_file, self.config_loaded))
+
+    def _on_config_loaded(self, path: str, data: Any, error: str):
+        try:
+            if error:
+                raise ValueError(error)
+            loaded_states = data.get("panels", data)
+            if isinstance(loaded_states, list) and len(loaded_states) == 4:
+                self.stop_all_streams()
+                self._sync_state_from_ui()
+                shown = [self.panel_states[self.active_index].get(k) for k in _UI_STATE_KEYS]
+                self.panel_states = loaded_states
+                for st in self.panel_states:
+                    st['running'] = False
+                self.active_index = 0
+                # Skip the setter/signal cascade when the form already shows panel 0's values
+                if [self.panel_states[0].get(k) for k in _UI_STATE_KEYS] != shown:
                     self._sync_ui_from_state()
-                    self._update_active_styles()
-                    self.status_lbl.setText(f"Configuration loaded from {path}")
-                else:
-                    raise ValueError("Config file must contain a list/key 'panels' of 4 states.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error Loading", f"Could not load config file:\n{e}")
+                self._update_active_styles()
+                self.status_lbl.setText(f"Configuration loaded from {path}")
+            else:
+                raise ValueError("Config file must contain a list/key 'panels' of 4 states.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error Loading", f"Could not load config file:\n{e}")
 
     def closeEvent(self, e):
         self.stop_all_streams()
@@ -1023,11 +1579,19 @@ class RtspApp(QWidget):
 
     def _make_status_updater(self, index: int):
         def update_status(msg: str):
+            self._status_queue[index] = msg
+            if not self._status_timer.isActive():
+                self._status_timer.start()
+        return update_status
+
+    def _flush_status(self):
+        """Apply the newest queued status of each panel to its labels."""
+        queued, self._status_queue = self._status_queue, {}
+        for index, msg in queued.items():
             pane_title = self.panel_states[index].get('title', f'Feed {index+1}')
             self.panes[index].title.setText(f"{pane_title}: {msg}")
             if index == self.active_index:
                 self.status_lbl.setText(f"Panel {index+1}: {msg}")
-        return update_status
 
 
 # ============================================================================